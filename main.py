@@ -1,15 +1,19 @@
 from fastapi import FastAPI, HTTPException, status, Query, Depends
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, validator
 import sqlite3
-import jwt
-import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+import json
+import orjson
+import redis
+import queue
+import time
+from contextlib import contextmanager
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from typing import List, Optional
+from collections import defaultdict
 
-# FastAPI instance
-app = FastAPI()
+# FastAPI instance; responses are encoded with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 oauth_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -19,11 +23,190 @@ oauth_scheme = OAuth2PasswordBearer(tokenUrl="token")
 # ========================
 DATABASE = 'orders_and_categories.db'
 
-def get_db():
-    db_connection = sqlite3.connect(DATABASE, check_same_thread=False)
+def create_connection():
+    # Pooled connections live for the whole process. The cache holds one statement per multi-row
+    # order_items INSERT size (up to 300), the ~11 padded IN-list sizes and the fixed handler SQL
+    db_connection = sqlite3.connect(DATABASE, check_same_thread=False, cached_statements=512)
     db_connection.row_factory = sqlite3.Row  # Enable access by column name
+    # WAL lets readers run alongside a writer; the rest are per-connection and must be set on every connect.
+    # foreign_keys stays off: feedback.dish_id references the non-unique order_items.dish_id
+    db_connection.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-64000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+    ''')
     return db_connection
 
+class ConnectionPool:
+    # Keeps up to `maxsize` configured connections open and hands them out to requests.
+    # Borrowing never waits: when every pooled connection is in use an overflow connection
+    # is opened, and it is closed on return if the pool is already full. Waiting here would
+    # park threadpool threads that the requests holding connections need to finish.
+    def __init__(self, maxsize=20, ping_after=30):
+        self.maxsize = maxsize
+        self.ping_after = ping_after  # Seconds a connection may sit idle before it is checked on borrow
+        self._idle = queue.Queue(maxsize=maxsize)
+
+    def get(self):
+        try:
+            db_connection, last_used = self._idle.get_nowait()
+        except queue.Empty:
+            return create_connection()
+
+        if time.monotonic() - last_used > self.ping_after:
+            try:
+                db_connection.execute('SELECT 1')
+            except sqlite3.Error:
+                db_connection.close()
+                db_connection = create_connection()
+        return db_connection
+
+    def put(self, db_connection):
+        if db_connection.in_transaction:
+            db_connection.rollback()
+        try:
+            self._idle.put_nowait((db_connection, time.monotonic()))
+        except queue.Full:
+            db_connection.close()
+
+    @contextmanager
+    def connection(self):
+        db_connection = self.get()
+        try:
+            yield db_connection
+        finally:
+            self.put(db_connection)
+
+# def handlers run in anyio's threadpool (40 threads by default), so up to 40 requests can
+# hold a connection at once; keep that many warm instead of reopening overflow connections
+THREADPOOL_SIZE = 40
+pool = ConnectionPool(maxsize=THREADPOOL_SIZE)
+
+def get_db():
+    # FastAPI dependency: borrow a pooled connection for the duration of the request
+    with pool.connection() as db_connection:
+        yield db_connection
+
+# SQLite caps bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER, 999 on older builds)
+MAX_QUERY_PARAMS = 900
+MAX_ITEMS_PER_INSERT = MAX_QUERY_PARAMS // 3  # order_items rows bind 3 parameters each
+# INSERT ... RETURNING hands back the new id with the insert itself (SQLite 3.35+)
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+def get_items_by_order(cursor, order_ids):
+    # Fetch the items of many orders at once instead of one query per order
+    items_by_order = defaultdict(list)
+    for start in range(0, len(order_ids), MAX_QUERY_PARAMS):
+        chunk = order_ids[start:start + MAX_QUERY_PARAMS]
+        # Pad the IN list to a power of two by repeating the last id, so only a handful of
+        # distinct statements reach the statement cache instead of one per order count
+        padded_size = min(1 << (len(chunk) - 1).bit_length(), MAX_QUERY_PARAMS)
+        chunk = chunk + chunk[-1:] * (padded_size - len(chunk))
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f'SELECT order_id, dish_id, quantity FROM order_items WHERE order_id IN ({placeholders})', chunk)
+        for order_id, dish_id, quantity in cursor:
+            items_by_order[order_id].append({"dish_id": dish_id, "quantity": quantity})
+    return items_by_order
+
+ORDERS_PAGE_SIZE = 500  # Orders read per connection borrow while streaming GET /orders
+
+def fetch_orders_page(after_order_id):
+    # Read the next page of orders (keyset on order_id) with their items, returning the
+    # connection before the page is written out so slow clients don't hold it
+    with pool.connection() as db:
+        cursor = db.cursor()
+        cursor.row_factory = None  # Plain tuples; columns are unpacked by position below
+        cursor.execute('SELECT order_id, user_id, status FROM orders WHERE order_id > ? ORDER BY order_id LIMIT ?',
+                       (after_order_id, ORDERS_PAGE_SIZE))
+        orders = cursor.fetchall()
+        items_by_order = get_items_by_order(cursor, [order_id for order_id, _, _ in orders])
+    return orders, items_by_order
+
+def stream_orders_json(orders, items_by_order):
+    # Emit the JSON array one page at a time so the full result never sits in memory
+    yield b'['
+    separator = b''
+    while orders:
+        yield separator + b','.join(
+            orjson.dumps({
+                "order_id": order_id,
+                "user_id": user_id,
+                "items": items_by_order[order_id],
+                "status": order_status
+            })
+            for order_id, user_id, order_status in orders
+        )
+        separator = b','
+        orders, items_by_order = fetch_orders_page(orders[-1][0])
+    yield b']'
+
+def insert_order_items(cursor, order_id, items):
+    # Insert (dish_id, quantity) items with several rows per statement
+    rows = [(order_id, dish_id, quantity) for dish_id, quantity in items]
+    for start in range(0, len(rows), MAX_ITEMS_PER_INSERT):
+        chunk = rows[start:start + MAX_ITEMS_PER_INSERT]
+        values_sql = ",".join(["(?, ?, ?)"] * len(chunk))
+        params = [value for row in chunk for value in row]
+        cursor.execute(f'INSERT INTO order_items (order_id, dish_id, quantity) VALUES {values_sql}', params)
+
+def insert_order(db, user_id, items):
+    # Insert the order and its (dish_id, quantity) items in a single transaction
+    cursor = db.cursor()
+    with db:
+        # Insert order into orders table
+        if SUPPORTS_RETURNING:
+            cursor.execute('INSERT INTO orders (user_id, status) VALUES (?, ?) RETURNING order_id', (user_id, 'Booked Successfully'))
+            order_id = cursor.fetchone()[0]
+        else:
+            cursor.execute('INSERT INTO orders (user_id, status) VALUES (?, ?)', (user_id, 'Booked Successfully'))
+            order_id = cursor.lastrowid  # Get the last inserted order ID
+
+        # Insert order items into order_items table
+        insert_order_items(cursor, order_id, items)
+    return order_id
+
+# ========================
+# Cache Setup
+# ========================
+CACHE_TTL = 300  # Seconds before a cached read expires
+CACHE_RETRY_AFTER = 30  # Seconds to stop calling Redis after it fails
+CATEGORIES_CACHE_KEY = 'cat:all'
+
+cache = redis.Redis(decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5)
+cache_down_until = 0.0
+
+def feedback_cache_key(dish_id):
+    return f'feedback:dish:{dish_id}'
+
+def run_cache_command(command, *args):
+    # Redis being unavailable only disables caching for a while; requests then fall through to SQLite
+    global cache_down_until
+    if time.monotonic() < cache_down_until:
+        return None
+    try:
+        return getattr(cache, command)(*args)
+    except redis.RedisError:
+        cache_down_until = max(cache_down_until, time.monotonic() + CACHE_RETRY_AFTER)
+        return None
+
+def cache_get(key):
+    cached = run_cache_command('get', key)
+    return json.loads(cached) if cached is not None else None
+
+def cache_set(key, value):
+    run_cache_command('setex', key, CACHE_TTL, json.dumps(value))
+
+def cache_delete(key):
+    # Invalidations are always attempted, even while reads are skipped. If one fails, the old
+    # value may still be in Redis, so keep reads off until it has expired on its own
+    global cache_down_until
+    try:
+        cache.delete(key)
+    except redis.RedisError:
+        cache_down_until = max(cache_down_until, time.monotonic() + CACHE_TTL)
+
 # ========================
 # Pydantic Models
 # ========================
@@ -35,6 +218,18 @@ class CreateOrder(BaseModel):
     user_id: int
     items: List[OrderItem]
 
+class CreateOrderBulk(BaseModel):
+    # Items as parallel lists: large carts validate plain ints instead of one OrderItem per item
+    user_id: int
+    dish_ids: List[int]
+    quantities: List[int]
+
+    @validator('quantities')
+    def quantities_match_dish_ids(cls, quantities, values):
+        if 'dish_ids' in values and len(quantities) != len(values['dish_ids']):
+            raise ValueError('quantities must have one entry per dish_id')
+        return quantities
+
 class OrderResponse(BaseModel):
     order_id: int
     user_id: int
@@ -70,111 +265,99 @@ class FeedbackResponse(BaseModel):
 # ========================
 # Order Management Routes
 # ========================
-@app.post("/orders", response_model=OrderResponse, status_code=status.HTTP_201_CREATED, tags=["Order Management"])
-async def create_order(order: CreateOrder):
+@app.post("/orders", response_model=None, responses={201: {"model": OrderResponse}}, status_code=status.HTTP_201_CREATED, tags=["Order Management"])
+def create_order(order: CreateOrder, db: sqlite3.Connection = Depends(get_db)):
     try:
-        db = get_db()
-        cursor = db.cursor()
+        order_id = insert_order(db, order.user_id, [(item.dish_id, item.quantity) for item in order.items])
 
-        # Insert order into orders table
-        cursor.execute('INSERT INTO orders (user_id, status) VALUES (?, ?)', (order.user_id, 'Booked Successfully'))
-        db.commit()
-        order_id = cursor.lastrowid  # Get the last inserted order ID
+        # The items were validated on the way in; skip re-validating them on the way out
+        return ORJSONResponse(status_code=status.HTTP_201_CREATED, content={
+            "order_id": order_id,
+            "user_id": order.user_id,
+            "items": [{"dish_id": item.dish_id, "quantity": item.quantity} for item in order.items],
+            "status": "Booked Successfully"
+        })
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating order: {str(e)}")
 
-        # Insert order items into order_items table
-        for item in order.items:
-            cursor.execute('INSERT INTO order_items (order_id, dish_id, quantity) VALUES (?, ?, ?)', 
-                           (order_id, item.dish_id, item.quantity))
-        db.commit()
+@app.post("/orders/bulk", response_model=None, responses={201: {"model": OrderResponse}}, status_code=status.HTTP_201_CREATED, tags=["Order Management"])
+def create_order_bulk(order: CreateOrderBulk, db: sqlite3.Connection = Depends(get_db)):
+    try:
+        order_id = insert_order(db, order.user_id, zip(order.dish_ids, order.quantities))
 
-        return {
+        # Validating the response would build one OrderItem per item, which this endpoint exists to avoid
+        return ORJSONResponse(status_code=status.HTTP_201_CREATED, content={
             "order_id": order_id,
             "user_id": order.user_id,
-            "items": order.items,
+            "items": [{"dish_id": dish_id, "quantity": quantity} for dish_id, quantity in zip(order.dish_ids, order.quantities)],
             "status": "Booked Successfully"
-        }
+        })
     except sqlite3.Error as e:
-        db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error creating order: {str(e)}")
 
-@app.get("/users/{user_id}/orders", response_model=List[OrderResponse], tags=["Order Management"])
-async def get_user_orders(user_id: int):
-    db = get_db()
+@app.get("/users/{user_id}/orders", response_model=None, responses={200: {"model": List[OrderResponse]}}, tags=["Order Management"])
+def get_user_orders(user_id: int, db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
-    cursor.execute('SELECT * FROM orders WHERE user_id = ?', (user_id,))
+    cursor.row_factory = None  # Plain tuples; columns are unpacked by position below
+    cursor.execute('SELECT order_id, user_id, status FROM orders WHERE user_id = ?', (user_id,))
     orders = cursor.fetchall()
 
     if not orders:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No orders found for user")
 
+    items_by_order = get_items_by_order(cursor, [order_id for order_id, _, _ in orders])
+
     response_orders = []
-    for order in orders:
-        cursor.execute('SELECT * FROM order_items WHERE order_id = ?', (order["order_id"],))
-        items = cursor.fetchall()
-        order_items = [{"dish_id": item["dish_id"], "quantity": item["quantity"]} for item in items]
+    for order_id, order_user_id, order_status in orders:
         response_orders.append({
-            "order_id": order["order_id"],
-            "user_id": order["user_id"],
-            "items": order_items,
-            "status": order["status"]
+            "order_id": order_id,
+            "user_id": order_user_id,
+            "items": items_by_order[order_id],
+            "status": order_status
         })
     
-    return response_orders
+    # Already shaped like List[OrderResponse] from typed columns; skip re-validating every order
+    return ORJSONResponse(content=response_orders)
 
-@app.patch("/orders/{order_id}/status", response_model=OrderResponse, tags=["Order Management"])
-async def update_order_status(order_id: int, status_update: UpdateOrderStatus,token: str = Depends(oauth_scheme)):
-    db = get_db()
+@app.patch("/orders/{order_id}/status", response_model=None, responses={200: {"model": OrderResponse}}, tags=["Order Management"])
+def update_order_status(order_id: int, status_update: UpdateOrderStatus,token: str = Depends(oauth_scheme), db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
-    cursor.execute('SELECT * FROM orders WHERE order_id = ?', (order_id,))
+    cursor.execute('SELECT user_id FROM orders WHERE order_id = ?', (order_id,))
     order = cursor.fetchone()
 
-    if not order:
+    if order is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
     
-    cursor.execute('UPDATE orders SET status = ? WHERE order_id = ?', (status_update.status, order_id))
-    db.commit()
+    with db:
+        cursor.execute('UPDATE orders SET status = ? WHERE order_id = ?', (status_update.status, order_id))
 
-    cursor.execute('SELECT * FROM order_items WHERE order_id = ?', (order_id,))
+    cursor.execute('SELECT dish_id, quantity FROM order_items WHERE order_id = ?', (order_id,))
     items = cursor.fetchall()
     order_items = [{"dish_id": item["dish_id"], "quantity": item["quantity"]} for item in items]
 
-    return {
-        "order_id": order["order_id"],
+    # Already shaped like OrderResponse from typed columns; skip re-validating it
+    return ORJSONResponse(content={
+        "order_id": order_id,
         "user_id": order["user_id"],
         "items": order_items,
         "status": status_update.status
-    }
+    })
 
-@app.get("/orders", response_model=List[OrderResponse], tags=["Order Management"])
-async def get_all_orders():
-    db = get_db()
-    cursor = db.cursor()
-
-    cursor.execute('SELECT * FROM orders')
-    orders = cursor.fetchall()
+@app.get("/orders", response_model=None, responses={200: {"model": List[OrderResponse]}}, tags=["Order Management"])
+def get_all_orders():
+    orders, items_by_order = fetch_orders_page(0)
 
     if not orders:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No orders found")
 
-    response_orders = []
-    for order in orders:
-        cursor.execute('SELECT * FROM order_items WHERE order_id = ?', (order["order_id"],))
-        items = cursor.fetchall()
-        order_items = [{"dish_id": item["dish_id"], "quantity": item["quantity"]} for item in items]
-        response_orders.append({
-            "order_id": order["order_id"],
-            "user_id": order["user_id"],
-            "items": order_items,
-            "status": order["status"]
-        })
-    
-    return response_orders
+    # Later pages are fetched as the response is written
+    return StreamingResponse(stream_orders_json(orders, items_by_order), media_type="application/json")
 
 
 
 
 @app.post("/token")
-async def token_generate(form_data: OAuth2PasswordRequestForm = Depends()):
+def token_generate(form_data: OAuth2PasswordRequestForm = Depends()):
     # Example: We return the username as the access token (in a real-world scenario, JWT tokens are recommended)
     return {"access_token": form_data.username, "token_type": "bearer"}
 
@@ -182,57 +365,60 @@ async def token_generate(form_data: OAuth2PasswordRequestForm = Depends()):
 # Category Management Routes
 # ========================
 @app.get("/categories", response_model=List[CategoryResponse], tags=["Category Management"])
-async def get_categories(token: str = Depends(oauth_scheme)):
-    db = get_db()
-    cursor = db.cursor()
-    cursor.execute('SELECT * FROM categories')
-    categories = cursor.fetchall()
+def get_categories(token: str = Depends(oauth_scheme)):
+    cached_categories = cache_get(CATEGORIES_CACHE_KEY)
+    if cached_categories is not None:
+        return cached_categories
+
+    # Only a cache miss needs a connection
+    with pool.connection() as db:
+        cursor = db.cursor()
+        cursor.execute('SELECT * FROM categories')
+        categories = cursor.fetchall()
 
     if not categories:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No categories found")
 
-    return [{"category_id": category["category_id"], "name": category["name"]} for category in categories]
+    response_categories = [{"category_id": category["category_id"], "name": category["name"]} for category in categories]
+    cache_set(CATEGORIES_CACHE_KEY, response_categories)
+    return response_categories
 
 @app.post("/categories", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED, tags=["Category Management"])
-async def add_category(category: CreateCategory,token: str = Depends(oauth_scheme)):
-    db = get_db()
+def add_category(category: CreateCategory,token: str = Depends(oauth_scheme), db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
 
-    # Check if the category already exists
-    cursor.execute('SELECT * FROM categories WHERE name = ?', (category.name,))
-    existing_category = cursor.fetchone()
-    if existing_category:
+    # Insert the new category; the UNIQUE name constraint turns a duplicate into a no-op
+    with db:
+        if SUPPORTS_RETURNING:
+            cursor.execute('INSERT INTO categories (name) VALUES (?) ON CONFLICT(name) DO NOTHING RETURNING category_id', (category.name,))
+            inserted = cursor.fetchone()
+            category_id = inserted[0] if inserted is not None else None
+        else:
+            cursor.execute('INSERT INTO categories (name) VALUES (?) ON CONFLICT(name) DO NOTHING', (category.name,))
+            category_id = cursor.lastrowid if cursor.rowcount else None
+    if category_id is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Category already exists")
-
-    # Insert the new category into the database
-    cursor.execute('INSERT INTO categories (name) VALUES (?)', (category.name,))
-    db.commit()
+    cache_delete(CATEGORIES_CACHE_KEY)
 
     return {
-        "category_id": cursor.lastrowid,
+        "category_id": category_id,
         "name": category.name
     }
 
 @app.put("/categories/{category_id}", tags=["Category Management"])
-async def update_category(category_id: int, updated_category: UpdateCategory,token: str = Depends(oauth_scheme)):
-    db = get_db()
+def update_category(category_id: int, updated_category: UpdateCategory,token: str = Depends(oauth_scheme), db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
 
-    # Check if the category exists
-    cursor.execute('SELECT * FROM categories WHERE category_id = ?', (category_id,))
-    existing_category = cursor.fetchone()
-    if not existing_category:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
-
-    # Check if the new name already exists in another category
-    cursor.execute('SELECT * FROM categories WHERE name = ? AND category_id != ?', (updated_category.name, category_id))
-    duplicate_category = cursor.fetchone()
-    if duplicate_category:
+    # Update the category name; no matched row means the category doesn't exist,
+    # and the UNIQUE name constraint rejects a name used by another category
+    try:
+        with db:
+            cursor.execute('UPDATE categories SET name = ? WHERE category_id = ?', (updated_category.name, category_id))
+    except sqlite3.IntegrityError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Category name already exists")
-
-    # Update the category name
-    cursor.execute('UPDATE categories SET name = ? WHERE category_id = ?', (updated_category.name, category_id))
-    db.commit()
+    if cursor.rowcount == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    cache_delete(CATEGORIES_CACHE_KEY)
 
     return {
         "message": f"Category with ID {category_id} updated successfully",
@@ -241,19 +427,19 @@ async def update_category(category_id: int, updated_category: UpdateCategory,tok
     }
 
 @app.delete("/categories/{category_id}", tags=["Category Management"])
-async def delete_category(category_id: int,token: str = Depends(oauth_scheme)):
-    db = get_db()
+def delete_category(category_id: int,token: str = Depends(oauth_scheme), db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
 
     # Check if the category exists
-    cursor.execute('SELECT * FROM categories WHERE category_id = ?', (category_id,))
+    cursor.execute('SELECT 1 FROM categories WHERE category_id = ? LIMIT 1', (category_id,))
     existing_category = cursor.fetchone()
-    if not existing_category:
+    if existing_category is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
 
     # Delete the category
-    cursor.execute('DELETE FROM categories WHERE category_id = ?', (category_id,))
-    db.commit()
+    with db:
+        cursor.execute('DELETE FROM categories WHERE category_id = ?', (category_id,))
+    cache_delete(CATEGORIES_CACHE_KEY)
 
     return {
         "message": f"Category with ID {category_id} deleted successfully"
@@ -263,97 +449,117 @@ async def delete_category(category_id: int,token: str = Depends(oauth_scheme)):
 # Feedback Routes
 # ========================
 @app.post("/feedback", response_model=FeedbackResponse, tags=["Feedback"])
-async def submit_feedback(feedback: Feedback):
-    db = get_db()
+def submit_feedback(feedback: Feedback, db: sqlite3.Connection = Depends(get_db)):
     cursor = db.cursor()
 
     try:
         # Check if the order exists
-        cursor.execute('SELECT * FROM orders WHERE order_id = ?', (feedback.order_id,))
+        cursor.execute('SELECT 1 FROM orders WHERE order_id = ? LIMIT 1', (feedback.order_id,))
         order = cursor.fetchone()
-        if not order:
+        if order is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
         # Insert feedback into feedback table
-        cursor.execute('''INSERT INTO feedback (user_id, order_id, dish_id, comments, rating)
-                          VALUES (?, ?, ?, ?, ?)''', 
-                          (feedback.user_id, feedback.order_id, feedback.dish_id, feedback.comments, feedback.rating))
-        db.commit()
+        with db:
+            cursor.execute('''INSERT INTO feedback (user_id, order_id, dish_id, comments, rating)
+                              VALUES (?, ?, ?, ?, ?)''', 
+                              (feedback.user_id, feedback.order_id, feedback.dish_id, feedback.comments, feedback.rating))
+        cache_delete(feedback_cache_key(feedback.dish_id))
 
         return {"message": "Feedback submitted successfully"}
     except sqlite3.Error as e:
-        db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error submitting feedback: {str(e)}")
 
 @app.get("/menu/dishes/{dish_id}/feedback", response_model=List[Feedback], tags=["Feedback"])
-async def get_feedback_for_dish(dish_id: int):
-    db = get_db()
-    cursor = db.cursor()
-    
-    cursor.execute('''SELECT * FROM feedback WHERE dish_id = ?''', (dish_id,))
-    feedbacks = cursor.fetchall()
+def get_feedback_for_dish(dish_id: int):
+    cached_feedbacks = cache_get(feedback_cache_key(dish_id))
+    if cached_feedbacks is not None:
+        return cached_feedbacks
 
-    if not feedbacks:
+    # Only a cache miss needs a connection
+    with pool.connection() as db:
+        cursor = db.cursor()
+        cursor.row_factory = None  # Plain tuples; columns are unpacked by position below
+        
+        cursor.execute('''SELECT user_id, order_id, dish_id, comments, rating FROM feedback WHERE dish_id = ?''', (dish_id,))
+
+        # Build the response straight from the cursor rather than buffering the rows with fetchall()
+        response_feedbacks = [
+            {"user_id": user_id, 
+             "order_id": order_id, 
+             "dish_id": feedback_dish_id, 
+             "comments": comments, 
+             "rating": rating}
+            for user_id, order_id, feedback_dish_id, comments, rating in cursor
+        ]
+
+    if not response_feedbacks:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No feedback found for this dish")
 
-    return [
-        {"user_id": feedback["user_id"], 
-         "order_id": feedback["order_id"], 
-         "dish_id": feedback["dish_id"], 
-         "comments": feedback["comments"], 
-         "rating": feedback["rating"]}
-        for feedback in feedbacks
-    ]
+    cache_set(feedback_cache_key(dish_id), response_feedbacks)
+    return response_feedbacks
 
 # ========================
 # Database Initialization
 # ========================
 @app.on_event("startup")
 def startup():
-    db = get_db()
-    cursor = db.cursor()
-    
-    # Create the orders table
-    cursor.execute('''CREATE TABLE IF NOT EXISTS orders (
-        order_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        status TEXT NOT NULL
-    )''')
-
-    # Create the order_items table
-    cursor.execute('''CREATE TABLE IF NOT EXISTS order_items (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        order_id INTEGER NOT NULL,
-        dish_id INTEGER NOT NULL,
-        quantity INTEGER NOT NULL,
-        FOREIGN KEY (order_id) REFERENCES orders (order_id)
-    )''')
-
-    # Create the categories table
-    cursor.execute('''CREATE TABLE IF NOT EXISTS categories (
-        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL UNIQUE
-    )''')
-
-    # Create the feedback table
-    cursor.execute('''CREATE TABLE IF NOT EXISTS feedback (
-        feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        order_id INTEGER NOT NULL,
-        dish_id INTEGER NOT NULL,
-        comments TEXT,
-        rating INTEGER NOT NULL,
-        FOREIGN KEY (order_id) REFERENCES orders (order_id),
-        FOREIGN KEY (dish_id) REFERENCES order_items (dish_id)
-    )''')
-
-    # Predefined categories to insert
-    predefined_categories = [
-        'Appetizer', 'Veg Curries', 'Pickles', 'Veg Fry', 'Dal',
-        'Non Veg Curries', 'Veg Rice', 'Non-Veg Rice', 'Veg Pulusu', 'Breads', 'Desserts'
-    ]
-    cursor.execute('SELECT COUNT(*) FROM categories')
-    if cursor.fetchone()[0] == 0:
-        cursor.executemany('INSERT INTO categories (name) VALUES (?)', [(name,) for name in predefined_categories])
-        db.commit()
+    with pool.connection() as db:
+        cursor = db.cursor()
+
+        # Run the whole bootstrap in one transaction so it is flushed to disk once
+        with db:
+            cursor.execute('BEGIN IMMEDIATE')
+
+            # Create the orders table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS orders (
+                order_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                status TEXT NOT NULL
+            )''')
+
+            # Create the order_items table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS order_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                order_id INTEGER NOT NULL,
+                dish_id INTEGER NOT NULL,
+                quantity INTEGER NOT NULL,
+                FOREIGN KEY (order_id) REFERENCES orders (order_id)
+            )''')
+
+            # Create the categories table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS categories (
+                category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )''')
+
+            # Create the feedback table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS feedback (
+                feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                order_id INTEGER NOT NULL,
+                dish_id INTEGER NOT NULL,
+                comments TEXT,
+                rating INTEGER NOT NULL,
+                FOREIGN KEY (order_id) REFERENCES orders (order_id),
+                FOREIGN KEY (dish_id) REFERENCES order_items (dish_id)
+            )''')
+
+            # Index the foreign-key columns the order and feedback lookups filter on
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_user ON orders(user_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items(order_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_dish ON feedback(dish_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_order ON feedback(order_id)')
+
+            # Predefined categories to insert
+            predefined_categories = [
+                'Appetizer', 'Veg Curries', 'Pickles', 'Veg Fry', 'Dal',
+                'Non Veg Curries', 'Veg Rice', 'Non-Veg Rice', 'Veg Pulusu', 'Breads', 'Desserts'
+            ]
+            # Seed only an empty table, so deleted categories stay deleted across restarts. The check
+            # runs inside the BEGIN IMMEDIATE transaction, and OR IGNORE keeps the seed idempotent
+            cursor.execute('SELECT 1 FROM categories LIMIT 1')
+            if cursor.fetchone() is None:
+                cursor.executemany('INSERT OR IGNORE INTO categories (name) VALUES (?)', [(name,) for name in predefined_categories])
+        cache_delete(CATEGORIES_CACHE_KEY)
 